@@ -1,13 +1,36 @@
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 import click
 from colorama import Fore, Style, init
-from tabulate import tabulate
 
 from fuseline.core.abc import NetworkAPI
-from fuseline.core.config import FuselineConfig, get_fuseline_config
+from fuseline.core.config import FuselineConfig, NetworkConfig, get_fuseline_config
 from fuseline.core.network import WorkflowNotFoundError
 
+_HEADER = Fore.GREEN + Style.BRIGHT
+_HEADERS = [
+    f"{_HEADER}Workflow Name{Style.RESET_ALL}",
+    f"{_HEADER}Input Shape{Style.RESET_ALL}",
+    f"{_HEADER}Outputs{Style.RESET_ALL}",
+]
+_ERROR = f"{Fore.RED}ERROR!{Style.RESET_ALL}"
+_ENGINE = f"{Fore.BLUE}Engine: {Fore.WHITE}"
+
+_INT_PATTERN = re.compile(r"[-+]?\d+")
+_FLOAT_PATTERN = re.compile(r"[-+]?(?:\d+\.\d*|\.\d+|\d+)(?:[eE][-+]?\d+)?")
+
+
+def _coerce(value: str) -> Any:
+    """Convert a command line value to int or float if it looks like one."""
+    if _INT_PATTERN.fullmatch(value):
+        return int(value)
+    if _FLOAT_PATTERN.fullmatch(value):
+        return float(value)
+    return value
+
 
 @click.group()
 def cli():
@@ -18,20 +41,18 @@ def cli():
 @click.pass_context
 def ls(ctx):
     """Show all workflows defined in a project."""
-    fuseline_config: FuselineConfig = get_fuseline_config()
+    from tabulate import tabulate
 
-    # Prepare data for tabulation
-    headers = [
-        Fore.GREEN + Style.BRIGHT + "Workflow Name" + Style.RESET_ALL,
-        Fore.GREEN + Style.BRIGHT + "Input Shape" + Style.RESET_ALL,
-        Fore.GREEN + Style.BRIGHT + "Outputs" + Style.RESET_ALL,
-    ]
+    fuseline_config: FuselineConfig = get_fuseline_config()
 
     table_data: List[List[str]] = []
 
-    for workflow in fuseline_config.workflows:
-        workflow = workflow.build()
-        workflow_name = Fore.CYAN + workflow.name + Style.RESET_ALL
+    # NOTE: Builds are independent and dominated by imports of the output nodes, so run them side by side.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        workflows: List[NetworkAPI] = list(executor.map(NetworkConfig.build, fuseline_config.workflows))
+
+    for workflow in workflows:
+        workflow_name = f"{Fore.CYAN}{workflow.name}{Style.RESET_ALL}"
         input_shape = "\n".join(
             [f"{input_name}[{input_type}]" for input_name, input_type in workflow.input_shape.items()]
         )
@@ -41,13 +62,13 @@ def ls(ctx):
         table_data.append([workflow_name, input_shape, outputs])
 
     # Create and print the table
-    table = tabulate(table_data, headers=headers, tablefmt="grid")
+    table = tabulate(table_data, headers=_HEADERS, tablefmt="grid")
 
     # click.echo("\n" + Fore.MAGENTA + Style.BRIGHT + "Workflows defined in the project:" + Style.RESET_ALL)
     click.echo(table)
 
     # Print additional config info if needed
-    click.echo(f"\n{Fore.BLUE}Engine: {Fore.WHITE}{fuseline_config.config.engine}{Style.RESET_ALL}")
+    click.echo(f"\n{_ENGINE}{fuseline_config.config.engine}{Style.RESET_ALL}")
 
 
 @cli.command(context_settings=dict(ignore_unknown_options=True, allow_extra_args=True))
@@ -63,35 +84,20 @@ def run(ctx, workflow_name: str):
     try:
         workflow: NetworkAPI = fuseline_config[workflow_name]
     except WorkflowNotFoundError:
-        color = Fore.RED
-        status = f"{color}ERROR!{Style.RESET_ALL}"
-
-        click.echo(f"{status} Workflow `{workflow_name}` not found.")
+        click.echo(f"{_ERROR} Workflow `{workflow_name}` not found.")
         return
 
     # Parse arguments
     params: Dict[str, Any] = {}
-    for i in range(0, len(ctx.args), 2):
-        key = ctx.args[i].lstrip("--")
-        value = ctx.args[i + 1] if i + 1 < len(ctx.args) else None
-        if value is not None:
-            try:
-                # Try to convert to int or float if possible
-                params[key] = int(value)
-            except ValueError:
-                try:
-                    params[key] = float(value)
-                except ValueError:
-                    params[key] = value
+    args = iter(ctx.args)
+    for key, value in zip(args, args):
+        params[key.removeprefix("--")] = _coerce(value)
 
     try:
         result_net = workflow.run(**params)
         click.echo(result_net.print_outputs())
     except Exception as e:
-        color = Fore.RED
-        status = f"{color}ERROR!{Style.RESET_ALL}"
-
-        click.echo(f"{status} {workflow_name}: {e!s}")
+        click.echo(f"{_ERROR} {workflow_name}: {e!s}")
 
 
 if __name__ == "__main__":
@@ -3,7 +3,7 @@ from typing import Any, Dict, List, Optional, Type, Union
 
 import networkx
 
-from fuseline.core.nodes import GearInput, GearNode, GearOutput, OutputNode
+from fuseline.core.nodes import GearInput, GearNode, GearOutput, NetworkNode, OutputNode
 
 
 class NetworkPlotAPI(metaclass=abc.ABCMeta):
@@ -15,10 +15,12 @@ class NetworkPlotAPI(metaclass=abc.ABCMeta):
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def meta(self) -> Dict[str, Any]:
         """Return metadata of network plot."""
         raise NotImplementedError
 
+    @abc.abstractmethod
     def to_file(self, filename: str) -> None:
         """Write plot to a file."""
         raise NotImplementedError
@@ -28,67 +30,86 @@ class NetworkAPI(metaclass=abc.ABCMeta):
     """Abstract class defining network actions."""
 
     @property
+    @abc.abstractmethod
     def name(self) -> str:
         """Name of the feature."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def version(self) -> str:
         """Version of the feature."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def identifier(self) -> int:
         """Identifier containing name and version."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def graph(self) -> networkx.MultiDiGraph:
         """Get computational graph representation."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def plot(self) -> NetworkPlotAPI:
         """Plot the network."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def roots(self) -> List[GearNode]:
         """Calculate ranks of gears in a network."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def input_shape(self) -> Dict[str, Type[Any]]:
         """Returns input shape of the computational graph."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def inputs(self) -> List[GearInput]:
         """Return all inputs with values of a graph."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def outputs(self) -> List[OutputNode]:
         """Return all outputs of a graph."""
         raise NotImplementedError
 
     @property
+    @abc.abstractmethod
     def results(self) -> List[GearOutput]:
         """Return results of the feature data flow."""
         raise NotImplementedError
 
+    @abc.abstractmethod
+    def predecessor_map(self) -> Dict[NetworkNode, List[NetworkNode]]:
+        """Return predecessor lists of every node."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
     def compute_next(self) -> List[OutputNode]:
         """Return next in line to compute nodes."""
         raise NotImplementedError
 
+    @abc.abstractmethod
     def copy(self, name: Optional[str] = None, version: Optional[str] = None) -> "NetworkAPI":
         """Copy existing network."""
         raise NotImplementedError
 
+    @abc.abstractmethod
     def set_input(self, input_data: Dict[str, Any]) -> None:
         """Set input data for the graph computation."""
         raise NotImplementedError
 
+    @abc.abstractmethod
     def print_outputs(self, tabular: bool = True, colored: bool = True, as_json: bool = False) -> Union[str, None]:
         """
         Print or return a formatted representation of the graph outputs.
@@ -103,6 +124,7 @@ class NetworkAPI(metaclass=abc.ABCMeta):
         """
         raise NotImplementedError
 
+    @abc.abstractmethod
     def run(self, **kwargs: Any) -> "NetworkAPI":
         """Compute all data nodes of the network."""
         raise NotImplementedError
@@ -111,6 +133,8 @@ class NetworkAPI(metaclass=abc.ABCMeta):
 class EngineAPI(metaclass=abc.ABCMeta):
     """Executor which contains low level operations for communication with RedisGears."""
 
+    __slots__ = ()
+
     def setup(self) -> None:
         """Prepare the given computation for executor."""
         raise NotImplementedError
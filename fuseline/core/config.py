@@ -1,62 +1,114 @@
+import functools
 import importlib
+import os
+import sys
 from pathlib import Path
-from typing import Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
-import toml
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr, field_serializer, model_validator
 
 from fuseline.core.abc import NetworkAPI
 from fuseline.core.network import Network, WorkflowNotFoundError
 
+if sys.version_info >= (3, 11):
+    import tomllib
+else:
+    import tomli as tomllib
 
+
+@functools.lru_cache(maxsize=None)
 def source_execution_node(path: str) -> Callable:
     """Parse source code node path and make Python runnable."""
     module_name, function_name = path.rsplit(".", 1)
-    module = importlib.import_module(module_name)
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
     return getattr(module, function_name)
 
 
 class EngineConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True)
+
     engine: str
 
 
 class NetworkConfig(BaseModel):
+    model_config = ConfigDict(defer_build=True, revalidate_instances="never")
+
     name: str
     outputs: List[str]  # Store paths as strings
 
+    @functools.cached_property
+    def resolved_outputs(self) -> List[Callable]:
+        """Output callables resolved from their source paths."""
+        return [source_execution_node(output) for output in self.outputs]
+
     def build(self) -> Network:
         return Network(
             self.name,
-            outputs=[source_execution_node(output) for output in self.outputs],
+            outputs=list(self.resolved_outputs),
         )
 
 
 class FuselineConfig(BaseModel):
+    # NOTE: `revalidate_instances="never"` pins the pydantic v2 default so nested workflows are not revalidated.
+    model_config = ConfigDict(arbitrary_types_allowed=True, defer_build=True, revalidate_instances="never")
+
     config: EngineConfig
     workflows: List[NetworkConfig] = Field(default_factory=list)
 
+    _index: Dict[str, NetworkConfig] = PrivateAttr(default_factory=dict)
+
     def __getitem__(self, workflow_name: str) -> NetworkAPI:
-        for workflow in self.workflows:
-            if workflow.name == workflow_name:
-                return workflow.build()
-        raise WorkflowNotFoundError
+        if not self._index:
+            # NOTE: Reversed so the first workflow wins on duplicate names, as with a linear scan.
+            self._index = {workflow.name: workflow for workflow in reversed(self.workflows)}
+
+        workflow = self._index.get(workflow_name)
+        if workflow is None:
+            raise WorkflowNotFoundError
+        return workflow.build()
+
+    @model_validator(mode="before")
+    @classmethod
+    def _workflows_from_table(cls, obj: Any) -> Any:
+        """Accept workflows as a `{name: outputs}` table, as written in pyproject.toml."""
+        if isinstance(obj, dict) and isinstance(obj.get("workflows"), dict):
+            obj = {
+                **obj,
+                "workflows": [{"name": wf_name, "outputs": outputs} for wf_name, outputs in obj["workflows"].items()],
+            }
+        return obj
 
     @classmethod
-    def parse_obj(cls, obj: Dict):
-        modified_obj = obj.copy()
-        if "workflows" in modified_obj and isinstance(modified_obj["workflows"], dict):
-            modified_obj["workflows"] = [
-                NetworkConfig(name=wf_name, outputs=outputs) for wf_name, outputs in modified_obj["workflows"].items()
-            ]
-        return super().parse_obj(modified_obj)
+    def model_construct_trusted(cls, obj: Dict) -> "FuselineConfig":
+        """Build configuration from already validated data, skipping pydantic validation."""
+        workflows = obj.get("workflows", [])
+        if isinstance(workflows, dict):
+            workflows = [{"name": wf_name, "outputs": outputs} for wf_name, outputs in workflows.items()]
+
+        return cls.model_construct(
+            config=EngineConfig.model_construct(engine=obj["config"]["engine"]),
+            workflows=[
+                workflow
+                if isinstance(workflow, NetworkConfig)
+                else NetworkConfig.model_construct(name=workflow["name"], outputs=list(workflow["outputs"]))
+                for workflow in workflows
+            ],
+        )
+
+    @field_serializer("workflows")
+    def _workflows_to_table(self, workflows: List[NetworkConfig]) -> Dict[str, List[str]]:
+        return {network.name: network.outputs for network in workflows}
+
 
-    def dict(self, *args, **kwargs):
-        result = super().dict(*args, **kwargs)
-        result["workflows"] = {network.name: network.outputs for network in self.workflows}
-        return result
+# NOTE: Keyed by (absolute path, mtime in ns, size) so an edited pyproject.toml is parsed again.
+_TOML_CACHE: Dict[Tuple[str, int, int], Dict[str, Any]] = {}
+_VALIDATED: Set[Tuple[str, int, int]] = set()
 
-    class Config:
-        arbitrary_types_allowed = True  # Allow arbitrary types in the model
+
+def _clear_config_cache() -> None:
+    """Drop all cached pyproject.toml parses and configurations."""
+    _TOML_CACHE.clear()
+    _VALIDATED.clear()
 
 
 def get_fuseline_config() -> Optional[FuselineConfig]:
@@ -78,19 +130,29 @@ def get_fuseline_config() -> Optional[FuselineConfig]:
 
     # Read and parse the TOML file
     try:
-        pyproject_data = toml.load(pyproject_path)
+        stat = os.stat(pyproject_path)
+        cache_key = (str(pyproject_path.resolve()), stat.st_mtime_ns, stat.st_size)
+        pyproject_data = _TOML_CACHE.get(cache_key)
+        if pyproject_data is None:
+            with pyproject_path.open("rb") as pyproject_file:
+                pyproject_data = _TOML_CACHE[cache_key] = tomllib.load(pyproject_file)
 
         # Check if [tool.fuseline] configuration is present
         if "tool" in pyproject_data and "fuseline" in pyproject_data["tool"]:
             config = pyproject_data["tool"]["fuseline"]
-            return FuselineConfig.parse_obj(config)
+            if cache_key in _VALIDATED:
+                return FuselineConfig.model_construct_trusted(config)
+
+            fuseline_config = FuselineConfig.model_validate(config)
+            _VALIDATED.add(cache_key)
+            return fuseline_config
         else:
             print("[tool.fuseline] configuration not found in pyproject.toml")
     except FileNotFoundError:
         print(f"Error: pyproject.toml file not found at {pyproject_path}")
     except PermissionError:
         print(f"Error: Permission denied when trying to read {pyproject_path}")
-    except toml.TomlDecodeError as e:
+    except tomllib.TOMLDecodeError as e:
         print(f"Error: Invalid TOML in pyproject.toml: {e}")
     except KeyError as e:
         print(f"Error: Expected key not found in pyproject.toml: {e}")
@@ -100,3 +162,6 @@ def get_fuseline_config() -> Optional[FuselineConfig]:
         print(f"Error: IO problem when reading pyproject.toml: {e}")
 
     return None
+
+
+get_fuseline_config.cache_clear = _clear_config_cache  # type: ignore[attr-defined]
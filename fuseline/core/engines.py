@@ -1,49 +1,90 @@
-from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+import functools
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from multiprocessing.context import BaseContext
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import ModuleType, TracebackType
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type
+
+from networkx import topological_sort
 
 from fuseline.core.abc import EngineAPI, NetworkAPI
-from fuseline.core.nodes import DataNode, GearNode, InvalidGraphError, OutputNode
+from fuseline.core.nodes import (
+    DataNode,
+    GearInputOutput,
+    GearNode,
+    GearOutput,
+    InvalidGraphError,
+    NetworkNode,
+    NodeRaisedError,
+    OutputNode,
+)
 from fuseline.utils.logging import get_logger
 
+if TYPE_CHECKING:
+    from dask.distributed import Client  # type: ignore[import]
+
 # Get the logger
 logger = get_logger()
 
+
+@functools.lru_cache(maxsize=None)
+def _dask_distributed() -> ModuleType:
+    """Import `dask.distributed` on first use only."""
+    import dask.distributed  # type: ignore[import]
+
+    return dask.distributed
+
+
+@functools.lru_cache(maxsize=None)
+def _distributed_plugins() -> ModuleType:
+    """Import `distributed.diagnostics.plugin` on first use only."""
+    import distributed.diagnostics.plugin  # type: ignore[import]
+
+    return distributed.diagnostics.plugin
+
+
+class _GearCallError(Exception):
+    """Exception raised by the gear at `index` of a chunk running in a pool worker."""
+
+    def __init__(self, index: int, raised: BaseException) -> None:
+        super().__init__(index, raised)
+        self.index = index
+        self.raised = raised
+
+
+def _run_gears(calls: List[Tuple[Callable[..., Any], Dict[str, Any]]]) -> List[Any]:
+    """Run a chunk of gear callables inside a pool worker; module level so it pickles by reference."""
+    results = []
+    for index, (func, params) in enumerate(calls):
+        try:
+            results.append(func(**params))
+        except BaseException as e:
+            raise _GearCallError(index, e) from e
+    return results
+
+
+def _validate_graph(pred: Dict[NetworkNode, List[NetworkNode]]) -> None:
+    """Check that every output node is produced by exactly one gear."""
+    for node, predeccesors in pred.items():
+        if isinstance(node, (GearOutput, GearInputOutput)) and len(predeccesors) != 1:
+            logger.error(f"Invalid graph structure: multiple predecessors for data node: {predeccesors}")
+            raise InvalidGraphError(
+                f"found a data node produced by multiple gears: {predeccesors}",
+                gears=predeccesors,
+            )
+
+
 class SerialEngine(EngineAPI):
     """Serial engine executor."""
 
+    __slots__ = ("_network", "_schedule")
+
     def __init__(self) -> None:
         """Serial engine constructor."""
         self._network: Optional[NetworkAPI] = None
+        self._schedule: List[Tuple[GearNode, List[OutputNode]]] = []
         logger.info("SerialEngine initialized")
 
-    def _submit_next(self) -> bool:
-        """Submit next batch of jobs to the pool."""
-        if self._network is None:
-            logger.error("Network not found in SerialEngine")
-            raise ValueError
-
-        computed: Dict[GearNode, Any] = {}
-
-        data_node: OutputNode
-        for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
-            if len(predeccesors) != 1:
-                logger.error(f"Invalid graph structure: multiple predecessors for data node: {predeccesors}")
-                raise InvalidGraphError(
-                    f"found a data node produced by multiple gears: {predeccesors}",
-                    gears=predeccesors,
-                )
-
-            gear = predeccesors[0]
-            logger.debug(f"Executing gear: {gear.name}")
-            result = gear(gear.input_values)
-
-            computed[gear] = result
-            data_node.set_value(result)
-
-        return bool(computed)
-
     def setup(self) -> None:
         """Prepare the given computation for executor."""
         logger.info("Setting up SerialEngine")
@@ -57,7 +98,7 @@ class SerialEngine(EngineAPI):
     def is_ready(self) -> bool:
         """Check if engine is ready for computation."""
         ready = True
-        logger.info(f"SerialEngine ready status: {ready}")
+        logger.info("SerialEngine ready status: {}", ready)
         return ready
 
     def execute(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
@@ -67,28 +108,56 @@ class SerialEngine(EngineAPI):
             raise ValueError("cannot execute empty network")
 
         self._network = network
+        _validate_graph(network.predecessor_map())
+
+        # NOTE: The graph is static, so a topological order of gears is a valid serial schedule. It bypasses
+        # `compute_next()`, but `set_input()` clears earlier outputs, so re-executing a network recomputes every
+        # gear exactly as the pool engines do.
+        graph = network.graph
+        self._schedule = [
+            (node, list(graph.successors(node)))  # type: ignore
+            for node in topological_sort(graph)
+            if isinstance(node, GearNode)
+        ]
         self._network.set_input(kwargs)
 
         logger.info("Starting network execution in SerialEngine")
-        while self._submit_next():
-            pass
+        for gear, outputs in self._schedule:
+            logger.debug("Executing gear: {}", gear.name)
+            result = gear(gear.input_values)
+            for data_node in outputs:
+                data_node.set_value(result)
         logger.info("Network execution completed in SerialEngine")
 
         return self._network
 
 
 class PoolEngine(EngineAPI):
-    """Pool engine executor."""
+    """Pool engine executor.
+
+    Gears run in worker processes by default; pass `executor_cls=ThreadPoolExecutor` for I/O-bound
+    networks to skip pickling gears, inputs and results.
+    """
+
+    __slots__ = ("_executor", "_executor_cls", "_max_workers", "_mp_context", "_network", "_pred")
 
-    def __init__(self, max_workers: int = 4) -> None:
+    def __init__(
+        self,
+        max_workers: int = 4,
+        mp_context: Optional[BaseContext] = None,
+        executor_cls: Callable[..., Executor] = ProcessPoolExecutor,
+    ) -> None:
         """Pool engine constructor."""
         self._network: Optional[NetworkAPI] = None
-        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pred: Dict[NetworkNode, List[NetworkNode]] = {}
+        self._executor: Optional[Executor] = None
+        self._executor_cls = executor_cls
         self._max_workers = max_workers
-        logger.info(f"PoolEngine initialized with max_workers: {max_workers}")
+        self._mp_context = mp_context
+        logger.info("PoolEngine initialized with max_workers: {}", max_workers)
 
-    def _submit_next(self) -> Dict[str, Any]:
-        """Submit next batch of jobs to the pool."""
+    def _submit_next(self, futures: Dict[Future[Any], List[Tuple[DataNode, GearNode]]]) -> None:
+        """Submit every ready gear which is not already running to the pool, in chunks."""
         if self._network is None:
             logger.error("Computational graph not found in PoolEngine")
             raise ValueError("computational graph not found")
@@ -97,46 +166,59 @@ class PoolEngine(EngineAPI):
             logger.error("PoolEngine not ready")
             raise ValueError("engine not ready")
 
-        results: Dict[str, Any] = {}
-        futures: Dict[Future[Any], Tuple[DataNode, GearNode]] = {}
-
-        data_node: DataNode
-        gear_node: GearNode
-        for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
-            if len(predeccesors) != 1:
-                logger.error(f"Invalid graph structure: multiple predecessors for data node: {predeccesors}")
-                raise InvalidGraphError(
-                    f"found a data node produced by multiple gears: {predeccesors}",
-                    gears=predeccesors,
-                )
-
-            gear_node = predeccesors[0]
-            logger.debug(f"Submitting gear for execution: {gear_node.name}")
-            future = self._executor.submit(gear_node, kwargs=gear_node.input_values)
-            futures[future] = (data_node, gear_node)
-
-        for future in as_completed(futures):
-            result_tpl: Tuple[DataNode, GearNode] = futures[future]
-            data_node, gear_node = result_tpl
-            value = future.result()
-
-            data_node.set_value(value)
-            results[gear_node.name] = value
-            logger.debug(f"Gear execution completed: {gear_node.name}")
-
-        return results
+        running = {data_node for chunk in futures.values() for data_node, _ in chunk}
+        recalled = True
+        while recalled:
+            # NOTE: Memoized results of pure gears are set right away, which may release further gears.
+            recalled = False
+            ready: List[Tuple[DataNode, GearNode]] = []
+            for data_node in self._network.compute_next():
+                if data_node in running:
+                    continue
+
+                gear_node: GearNode = self._pred[data_node][0]  # type: ignore
+                if gear_node.pure:
+                    hit, result = gear_node.recall(gear_node.input_values)
+                    if hit:
+                        logger.debug("Gear result recalled: {}", gear_node.name)
+                        data_node.set_value(result)
+                        recalled = True
+                        continue
+
+                ready.append((data_node, gear_node))
+
+        if not ready:
+            return
+
+        chunksize = max(1, len(ready) // (4 * self._max_workers))
+        for start in range(0, len(ready), chunksize):
+            chunk = ready[start : start + chunksize]
+            logger.opt(lazy=True).debug(
+                "Submitting gears for execution: {}", lambda chunk=chunk: [gear_node.name for _, gear_node in chunk]
+            )
+            # NOTE: Only the callable and its inputs are shipped; pickling the gear would drag its whole graph along.
+            future = self._executor.submit(
+                _run_gears, [(gear_node.func, gear_node.input_values) for _, gear_node in chunk]
+            )
+            futures[future] = chunk
 
     def is_ready(self) -> bool:
         """Check if engine is ready for computation."""
         ready = self._executor is not None
-        logger.info(f"PoolEngine ready status: {ready}")
+        logger.info("PoolEngine ready status: {}", ready)
         return ready
 
     def setup(self) -> None:
-        """Prepare the given computation for executor."""
-        logger.info(f"Setting up PoolEngine with {self._max_workers} workers")
-        self._executor = ProcessPoolExecutor(max_workers=self._max_workers)
+        """Start the worker pool; it is kept alive across `execute()` calls until `teardown()`."""
+        if self._executor is not None:
+            return
+
+        logger.info("Setting up PoolEngine with {} workers", self._max_workers)
+        options: Dict[str, Any] = {}
+        if self._mp_context is not None:
+            options["mp_context"] = self._mp_context
+
+        self._executor = self._executor_cls(max_workers=self._max_workers, **options)
 
     def execute(self, network: Optional[NetworkAPI], **kwargs: Any) -> NetworkAPI:
         """Runs the computational network and returns the result object."""
@@ -144,12 +226,34 @@ class PoolEngine(EngineAPI):
             logger.error("Cannot execute empty network")
             raise ValueError("cannot execute empty network")
 
+        if self._executor is None:
+            self.setup()
+
         self._network = network
+        self._pred = network.predecessor_map()
+        _validate_graph(self._pred)
         self._network.set_input(kwargs)
 
         logger.info("Starting network execution in PoolEngine")
-        while self._submit_next():
-            pass
+        # NOTE: Downstream gears are submitted as soon as their inputs are set instead of waiting for a whole wave.
+        futures: Dict[Future[Any], List[Tuple[DataNode, GearNode]]] = {}
+        self._submit_next(futures)
+        while futures:
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                chunk = futures.pop(future)
+                try:
+                    results = future.result()
+                except _GearCallError as e:
+                    gear_node = chunk[e.index][1]
+                    raise NodeRaisedError(gear_node, gear_node.input_values, e.raised) from e.raised
+                for (data_node, gear_node), result in zip(chunk, results):
+                    if gear_node.pure:
+                        gear_node.store(gear_node.input_values, result)
+                    data_node.set_value(result)
+                    logger.debug("Gear execution completed: {}", gear_node.name)
+
+            self._submit_next(futures)
         logger.info("Network execution completed in PoolEngine")
 
         return self._network
@@ -160,25 +264,60 @@ class PoolEngine(EngineAPI):
         raise NotImplementedError
 
     def teardown(self) -> None:
-        """Cleanup phase."""
+        """Shut down the worker pool."""
         if self._executor is None:
             logger.error("PoolEngine not running")
             raise ValueError("engine not running")
 
         logger.info("Tearing down PoolEngine")
         self._executor.shutdown(wait=True)
+        self._executor = None
+
+    def __del__(self) -> None:
+        """Release workers of an engine dropped without `teardown()`, such as a network's default engine."""
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
+
+    def __enter__(self) -> "PoolEngine":
+        """Start the worker pool for the duration of a `with` block."""
+        self.setup()
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Shut the worker pool down when leaving a `with` block."""
+        if self._executor is not None:
+            self.teardown()
 
 
 class DaskEngine(EngineAPI):
     """Dask engine executor."""
 
+    __slots__ = (
+        "_address",
+        "_config",
+        "_egg_path",
+        "_executor",
+        "_network",
+        "_pred",
+        "_requirements",
+        "dask_clean",
+        "dask_install",
+        "dask_update",
+    )
+
     def __init__(self, address: str, requirements: List[str], egg_path: Path, **config: Any) -> None:
         """Dask engine constructor."""
-        from dask.distributed import Client, as_completed  # type: ignore[import]
+        _dask_distributed()
 
-        self.as_completed = as_completed
-        self._executor: Optional[Client] = None
+        self._executor: Optional["Client"] = None
         self._network: Optional[NetworkAPI] = None
+        self._pred: Dict[NetworkNode, List[NetworkNode]] = {}
 
         self._address = address
         self._requirements = requirements
@@ -190,7 +329,7 @@ class DaskEngine(EngineAPI):
         self.dask_clean = lambda os: os.system("find . -type f -name '*.egg' -delete")  # type: ignore
         self.dask_update = lambda os: os.system("pip install -U setuptools cloudpickle blosc lz4 msgpack numpy")  # type: ignore
 
-        logger.info(f"DaskEngine initialized with address: {address}")
+        logger.info("DaskEngine initialized with address: {}", address)
 
     def _submit_next(self) -> bool:
         """Submit next batch of jobs to the pool."""
@@ -203,32 +342,35 @@ class DaskEngine(EngineAPI):
             raise ValueError("engine not found")
 
         futures = {}
+        recalled = False
         gear: GearNode
         data_node: OutputNode
 
         for data_node in self._network.compute_next():
-            predeccesors: List[GearNode] = list(self._network.graph.predecessors(data_node))  # type: ignore
-            if len(predeccesors) != 1:
-                logger.error(f"Invalid graph structure: multiple predecessors for data node: {predeccesors}")
-                raise InvalidGraphError(
-                    f"found a data node produced by multiple gears: {predeccesors}",
-                    gears=predeccesors,
-                )
-
-            gear = predeccesors[0]
-            data_node.set_value(gear(gear.input_values))
-
-            logger.debug(f"Submitting gear for execution: {gear.name}")
+            gear = self._pred[data_node][0]  # type: ignore
+            # NOTE: Gears are pickled to the workers, so pure gear memos are only kept up to date on this side.
+            if gear.pure:
+                hit, result = gear.recall(gear.input_values)
+                if hit:
+                    logger.debug("Gear result recalled: {}", gear.name)
+                    data_node.set_value(result)
+                    recalled = True
+                    continue
+
+            logger.debug("Submitting gear for execution: {}", gear.name)
             future = self._executor.submit(gear, kwargs=gear.input_values)  # type: ignore
             futures[future] = (data_node, gear)
 
         if not futures:
-            return False
+            return recalled
 
-        for future in self.as_completed(futures):  # type: ignore
+        for future in _dask_distributed().as_completed(futures):
             data_node, gear = futures[future]  # type: ignore
-            data_node.set_value(future.result())  # type: ignore
-            logger.debug(f"Gear execution completed: {gear.name}")
+            result = future.result()
+            if gear.pure:
+                gear.store(gear.input_values, result)
+            data_node.set_value(result)  # type: ignore
+            logger.debug("Gear execution completed: {}", gear.name)
 
         return True
 
@@ -236,13 +378,12 @@ class DaskEngine(EngineAPI):
         """Prepare the given computation for executor."""
         import importlib
 
-        from dask.distributed import Client, PipInstall
-        from distributed.diagnostics.plugin import UploadFile  # type: ignore[import]
+        distributed = _dask_distributed()
 
-        logger.info(f"Setting up DaskEngine with address: {self._address}")
-        self._executor = Client(self._address, timeout=30)
-        install_deps = PipInstall(packages=self._requirements, pip_options=["--upgrade"])
-        upload_egg = UploadFile(self._egg_path)
+        logger.info("Setting up DaskEngine with address: {}", self._address)
+        self._executor = distributed.Client(self._address, timeout=30)
+        install_deps = distributed.PipInstall(packages=self._requirements, pip_options=["--upgrade"])
+        upload_egg = _distributed_plugins().UploadFile(self._egg_path)
 
         self._executor.run(lambda ilib: ilib.invalidate_caches(), importlib)  # type: ignore
 
@@ -256,7 +397,7 @@ class DaskEngine(EngineAPI):
     def is_ready(self) -> bool:
         """Check if engine is ready for computation."""
         ready = self._executor is not None
-        logger.info(f"DaskEngine ready status: {ready}")
+        logger.info("DaskEngine ready status: {}", ready)
         return ready
 
     def execute(self, network: NetworkAPI, **kwargs: Any) -> NetworkAPI:
@@ -270,6 +411,8 @@ class DaskEngine(EngineAPI):
             raise ValueError("engine is not ready")
 
         self._network = network
+        self._pred = network.predecessor_map()
+        _validate_graph(self._pred)
         self._network.set_input(kwargs)
 
         logger.info("Starting network execution in DaskEngine")
@@ -1,14 +1,18 @@
+import copy
 import inspect
 import json
+import os
 import zlib
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
     Generic,
     List,
     Optional,
-    Set,
     Tuple,
     Type,
     Union,
@@ -16,13 +20,10 @@ from typing import (
 
 import numpy
 from colorama import Fore, Style
-from networkx import MultiDiGraph
-from networkx.algorithms.dag import descendants
-from networkx.algorithms.traversal.breadth_first_search import bfs_edges
-from tabulate import tabulate
+from networkx import MultiDiGraph, topological_generations
 
 from fuseline.core.abc import EngineAPI, NetworkAPI, NetworkPlotAPI
-from fuseline.core.engines import SerialEngine
+from fuseline.core.engines import PoolEngine, SerialEngine
 from fuseline.core.nodes import (
     DataNode,
     GearInput,
@@ -45,12 +46,12 @@ class WorkflowNotFoundError(Exception):
 class Depends(Generic[T]):
     """Express input dependency."""
 
-    def __init__(self, func: Callable[..., Any]) -> None:
-        """Constructor for dependency edge."""
+    def __init__(self, func: Callable[..., Any], jit: bool = False, pure: bool = False, cache_size: int = 128) -> None:
+        """Constructor for dependency edge; options are passed on to the dependency's `GearNode`."""
         from fuseline.core.nodes import GearNode
 
         self._func: Callable[..., Any] = func
-        self._gear = GearNode(self._func)
+        self._gear = GearNode(self._func, jit=jit, pure=pure, cache_size=cache_size)
 
     @property
     def gear(self) -> GearNode:
@@ -64,8 +65,34 @@ class NetworkPropertyMixin(NetworkAPI):
         """Network property mixin."""
         self._name = name
         self._version = version
+        self._identifier: int = zlib.crc32(f"{name}-{version}".encode())
 
         self._graph = graph
+        self._invalidate_caches()
+
+    def _invalidate_caches(self) -> None:
+        """Forget node lists derived from the graph; called whenever the graph grows."""
+        self._roots: Optional[List[GearNode]] = None
+        self._inputs: Optional[List[GearInput]] = None
+        self._inputs_by_name: Optional[Dict[str, List[GearInput]]] = None
+        self._outputs: Optional[List[OutputNode]] = None
+        self._input_shape: Optional[Dict[str, Type[Any]]] = None
+        self._succ: Optional[Dict[NetworkNode, List[NetworkNode]]] = None
+        self._pred: Optional[Dict[NetworkNode, List[NetworkNode]]] = None
+
+    def _successor_map(self) -> Dict[NetworkNode, List[NetworkNode]]:
+        """Successor lists of every node, so hot paths iterate plain lists instead of networkx views."""
+        if self._succ is None:
+            self._succ = {node: list(successors) for node, successors in self._graph.succ.items()}
+
+        return self._succ
+
+    def predecessor_map(self) -> Dict[NetworkNode, List[NetworkNode]]:
+        """Predecessor lists of every node, so hot paths iterate plain lists instead of networkx views."""
+        if self._pred is None:
+            self._pred = {node: list(predecessors) for node, predecessors in self._graph.pred.items()}
+
+        return self._pred
 
     def __repr__(self) -> str:
         """String representation."""
@@ -84,8 +111,7 @@ class NetworkPropertyMixin(NetworkAPI):
     @property
     def identifier(self) -> int:
         """Identifier containing name and version."""
-        _id: int = zlib.crc32(bytes(f"{self._name}-{self._version}", "utf-8"))
-        return _id
+        return self._identifier
 
     @property
     def graph(self) -> MultiDiGraph:
@@ -102,48 +128,60 @@ class NetworkPropertyMixin(NetworkAPI):
     @property
     def roots(self) -> List[GearNode]:
         """Calculate ranks of gears in a network."""
+        if self._roots is not None:
+            return self._roots
+
+        pred = self.predecessor_map()
 
         def check_predecessors(node: NetworkNode) -> bool:
             """Checks predecessors of a node."""
             if not isinstance(node, GearNode):
                 return False
 
-            all_inputs = [True if isinstance(p, GearInput) else False for p in self._graph.predecessors(node)]  # type: ignore
-
-            return all(all_inputs) or not all_inputs
+            # NOTE: `all()` of no predecessors is True, so gears without parameters are roots as well.
+            return all(isinstance(p, GearInput) for p in pred[node])
 
-        roots: List[GearNode] = [
+        self._roots = [
             node
             for node in self._graph.nodes  # type: ignore
             if check_predecessors(node)  # type: ignore
         ]
 
-        return roots
+        return self._roots
 
     @property
     def input_shape(self) -> Dict[str, Type[Any]]:
         """Returns input shape of the computational graph."""
-        inputs: Dict[str, Type[Any]] = {
-            node.name: node.annotation for node in self._graph.nodes if isinstance(node, GearInput)
-        }  # type: ignore
+        if self._input_shape is None:
+            self._input_shape = {node.name: node.annotation for node in self.inputs}
 
-        return inputs
+        return self._input_shape
 
     @property
     def inputs(self) -> List[GearInput]:
         """Return all inputs with values of a graph."""
-        inputs: List[GearInput] = [node for node in self._graph.nodes if isinstance(node, GearInput)]  # type: ignore
+        if self._inputs is None:
+            self._inputs = [node for node in self._graph.nodes if isinstance(node, GearInput)]  # type: ignore
+
+        return self._inputs
+
+    @property
+    def inputs_by_name(self) -> Dict[str, List[GearInput]]:
+        """Return graph inputs grouped by name; gears may share an input name."""
+        if self._inputs_by_name is None:
+            self._inputs_by_name = {}
+            for node in self.inputs:
+                self._inputs_by_name.setdefault(node.name, []).append(node)
 
-        return inputs
+        return self._inputs_by_name
 
     @property
     def outputs(self) -> List[OutputNode]:
         """Return all outputs of a graph."""
-        outputs: List[OutputNode] = [
-            node for node in self._graph.nodes if isinstance(node, GearInputOutput) or isinstance(node, GearOutput)
-        ]  # type: ignore
+        if self._outputs is None:
+            self._outputs = [node for node in self._graph.nodes if isinstance(node, (GearInputOutput, GearOutput))]  # type: ignore
 
-        return outputs
+        return self._outputs
 
     def print_outputs(self, tabular: bool = True, colored: bool = True, as_json: bool = False) -> Union[str, None]:
         """
@@ -196,6 +234,8 @@ class NetworkPropertyMixin(NetworkAPI):
             )
 
         if tabular:
+            from tabulate import tabulate
+
             headers = [
                 "Node",
                 "Type",
@@ -218,26 +258,59 @@ class Network(NetworkPropertyMixin):
     def __init__(
         self,
         name: str,
-        outputs: Optional[List[Callable[..., numpy.ndarray]]] = None,
+        outputs: Optional[List[Union[Callable[..., numpy.ndarray], Depends]]] = None,
         version: str = "0.1.0",
         engine: Optional[EngineAPI] = None,
     ) -> None:
-        """Network constructor."""
-        logger.info(f"Initializing Network: {name} (version: {version})")
+        """
+        Network constructor.
+
+        Outputs are plain callables, or `Depends(func, jit=..., pure=..., cache_size=...)` to pass gear options
+        to an output gear just like to its dependencies.
+        """
+        logger.info("Initializing Network: {} (version: {})", name, version)
         self._outputting_nodes = outputs or []
         self._graph: MultiDiGraph = MultiDiGraph(name=name)
 
         self._last_results: List[Tuple[str, str]]
 
         for output in self._outputting_nodes:
-            gear = GearNode(output, graph=self._graph)
+            gear = output.gear if isinstance(output, Depends) else GearNode(output, graph=self._graph)
             self._attach_output(gear, graph_output=True)
             self._add_gear(gear)
 
-        if engine is None:
-            self._engine = SerialEngine()
+        self._setup(name, version, self._graph, self._outputting_nodes, engine)
+
+    def _setup(
+        self,
+        name: str,
+        version: str,
+        graph: MultiDiGraph,
+        outputs: List[Union[Callable[..., numpy.ndarray], Depends]],
+        engine: Optional[EngineAPI],
+    ) -> None:
+        """Initialize the state of a network around an already built graph; shared by `__init__` and `copy()`."""
+        self._outputting_nodes = outputs
+        self._graph = graph
+        self._engine: EngineAPI = engine or self._default_engine()
+
+        self._reset_schedule()
+
+        super().__init__(name, version, graph)
+
+    def _default_engine(self) -> EngineAPI:
+        """Run gears on a thread pool when some of them can run side by side, serially otherwise."""
+        width = max(
+            (
+                sum(1 for node in generation if isinstance(node, GearNode))
+                for generation in topological_generations(self._graph)
+            ),
+            default=0,
+        )
+        if width > 1:
+            return PoolEngine(max_workers=min(width, os.cpu_count() or 1), executor_cls=ThreadPoolExecutor)
 
-        super().__init__(name, version, self._graph)
+        return SerialEngine()
 
     def _attach_input(self, param: inspect.Parameter, dst: GearNode) -> None:
         """Attach input to the gear."""
@@ -246,6 +319,7 @@ class Network(NetworkPropertyMixin):
 
         gear_input = GearInput(param.name, value, annotation, graph=self._graph)
         self._graph.add_edge(gear_input, dst)  # type: ignore
+        self._invalidate_caches()
 
     def _attach_output(self, src_gear: GearNode, name: Optional[str] = None, graph_output: bool = False) -> OutputNode:
         """Attach output to the gear."""
@@ -259,11 +333,13 @@ class Network(NetworkPropertyMixin):
             src_gear_output = GearInputOutput(name, None, src_gear.output_type, graph=self._graph)
 
         self._graph.add_edge(src_gear, src_gear_output)  # type: ignore
+        self._invalidate_caches()
         return src_gear_output
 
     def _add_gear(self, gear: GearNode) -> None:
         """Add gear to the graph."""
         gear.set_graph(self._graph)
+        self._invalidate_caches()
 
         for name, param in gear.params.items():
             if param.default and isinstance(param.default, Depends):
@@ -274,45 +350,77 @@ class Network(NetworkPropertyMixin):
             else:
                 self._attach_input(param, gear)
 
+    def _reset_schedule(self) -> None:
+        """Forget scheduling progress; the ready queue is rebuilt on the next `compute_next()` call."""
+        self._pending: Optional[Dict[GearNode, int]] = None
+        self._ready: Deque[OutputNode] = deque()
+        self._issued: List[OutputNode] = []
+
+    def _push_ready(self, gear: GearNode) -> None:
+        """Queue every not yet computed output of a gear whose inputs are all computed."""
+        self._ready.extend(output for output in self._successor_map()[gear] if not output.is_set)  # type: ignore
+
     def compute_next(self) -> List[OutputNode]:
         """Returns next nodes ready for evaluation."""
         logger.debug("Computing next nodes for evaluation")
-        outputs: Set[OutputNode] = {
-            dst
-            for r in self.roots
-            for _, dst in bfs_edges(self._graph, r)  # type: ignore
-            if (isinstance(dst, GearOutput) or isinstance(dst, GearInputOutput))
-            and dst.is_empty  # TODO: check for 'OutputNode'
-        }
-
-        reachable: Set[NetworkNode] = {node for output in outputs for node in descendants(self._graph, output)}  # type: ignore
-
-        result: List[OutputNode] = [node for node in outputs if node not in reachable]
-
-        return result
+        if self._pending is None:
+            # NOTE: A gear is pending on every intermediate output it consumes which has not been computed yet.
+            # Completion is tracked with `is_set` rather than `is_empty`, since a gear may legitimately return None.
+            self._pending = {}
+            for node, predecessors in self.predecessor_map().items():
+                if isinstance(node, GearNode):
+                    self._pending[node] = sum(
+                        1 for p in predecessors if isinstance(p, GearInputOutput) and not p.is_set
+                    )
+                    if not self._pending[node]:
+                        self._push_ready(node)
+
+        succ = self._successor_map()
+        gear: GearNode
+        issued: List[OutputNode] = []
+        for output in self._issued:
+            if not output.is_set:
+                issued.append(output)
+                continue
+
+            for gear in succ[output]:  # type: ignore
+                self._pending[gear] -= 1
+                if not self._pending[gear]:
+                    self._push_ready(gear)
+
+        while self._ready:
+            issued.append(self._ready.popleft())
+
+        self._issued = issued
+        return list(issued)
+
+    def _clone_graph(self, name: str) -> MultiDiGraph:
+        """Clone the graph with fresh nodes instead of re-deriving it from gear signatures."""
+        clones: Dict[NetworkNode, NetworkNode] = {node: copy.copy(node) for node in self._graph.nodes}  # type: ignore
+        graph = MultiDiGraph(name=name)
+        graph.add_nodes_from(clones.values())
+        graph.add_edges_from((clones[u], clones[v], key) for u, v, key in self._graph.edges(keys=True))  # type: ignore
+
+        for node in clones.values():
+            node.set_graph(graph)
+            if isinstance(node, DataNode):
+                node.reset()
+
+        return graph
 
     def copy(self, name: Optional[str] = None, version: Optional[str] = None) -> "Network":
         """Create a copy of an `Network` instance."""
         _version = version or self._version
         _name = name or self._name
 
-        return Network(_name, outputs=self._outputting_nodes, version=_version)  # type: ignore
-
-    def _check_input_data(self, input_data: Dict, expected_shape: Dict, as_json: bool = False) -> Optional[str]:
-        """
-        Check if the input data matches the expected shape.
-
-        Args:
-        input_data (dict): The input data to be checked.
-        expected_shape (dict): The expected shape of the input data.
-        as_json (bool): If True, return the result as a JSON string.
+        network = type(self).__new__(type(self))
+        network._setup(_name, _version, self._clone_graph(_name), self._outputting_nodes, self._engine)
 
-        Returns:
-        Optional[str]: JSON string if as_json is True, None otherwise.
+        return network
 
-        Raises:
-        ValueError: If the input data doesn't match the expected shape.
-        """
+    @staticmethod
+    def _build_mismatch_report(input_data: Dict, expected_shape: Dict) -> List[List[Any]]:
+        """Build one colored `[key, expected, provided, status]` row per provided or expected key."""
         all_keys = set(expected_shape.keys()) | set(input_data.keys())
         table_data = []
 
@@ -329,11 +437,27 @@ class Network(NetworkPropertyMixin):
 
             table_data.append([key, expected_value, provided_value, status])
 
-        table = tabulate(
-            table_data,
-            headers=["Key", "Expected", "Provided", "Status"],
-            tablefmt="grid",
-        )
+        return table_data
+
+    def _check_input_data(self, input_data: Dict, expected_shape: Dict, as_json: bool = False) -> Optional[str]:
+        """
+        Check if the input data matches the expected shape.
+
+        Args:
+        input_data (dict): The input data to be checked.
+        expected_shape (dict): The expected shape of the input data.
+        as_json (bool): If True, return the result as a JSON string.
+
+        Returns:
+        Optional[str]: JSON string if as_json is True, None otherwise.
+
+        Raises:
+        ValueError: If the input data doesn't match the expected shape.
+        """
+        if not as_json and input_data.keys() == expected_shape.keys():
+            return None
+
+        table_data = self._build_mismatch_report(input_data, expected_shape)
 
         if as_json:
             json_data = {
@@ -349,24 +473,32 @@ class Network(NetworkPropertyMixin):
             }
             return json.dumps(json_data, indent=2)
 
-        if set(input_data.keys()) != set(expected_shape.keys()):
-            error_message = f"Input data format is incorrect!\n\n{table}\n\n"
-            error_message += (
-                "Please ensure that the input data matches the expected format defined in `network.input_shape`."
-            )
-            raise ValueError(error_message)
+        from tabulate import tabulate
 
-        return None
+        table = tabulate(
+            table_data,
+            headers=["Key", "Expected", "Provided", "Status"],
+            tablefmt="grid",
+        )
+        error_message = f"Input data format is incorrect!\n\n{table}\n\n"
+        error_message += (
+            "Please ensure that the input data matches the expected format defined in `network.input_shape`."
+        )
+        raise ValueError(error_message)
 
     def set_input(self, input_data: Dict[str, Any]) -> None:
         """Set input data for the graph computation."""
-        logger.info(f"Setting input data: {input_data}")
+        logger.info("Setting input data: {}", input_data)
         self._check_input_data(input_data, self.input_shape)
+        # NOTE: Outputs of a previous execution are cleared so every engine recomputes them from the new inputs.
+        for output in self.outputs:
+            output.reset()
+        self._reset_schedule()
 
-        inputs: Dict[str, DataNode] = {node.name: node for node in self._graph.nodes if isinstance(node, GearInput)}  # type: ignore
-
+        inputs = self.inputs_by_name
         for name, value in input_data.items():
-            inputs[name].set_value(value)
+            for node in inputs[name]:
+                node.set_value(value)
 
     @property
     def results(self) -> List[GearOutput]:
@@ -381,7 +513,7 @@ class Network(NetworkPropertyMixin):
 
     def run(self, **kwargs: Any) -> NetworkAPI:
         """Compute all data nodes of the network."""
-        logger.info(f"Running network with kwargs: {kwargs}")
+        logger.info("Running network with kwargs: {}", kwargs)
         if self._engine is None:
             raise ValueError("engine not running")
 
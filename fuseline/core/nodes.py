@@ -1,5 +1,9 @@
+import functools
 import inspect
-from typing import Any, Callable, Dict, List, Optional, Union
+import types
+import typing
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple, Union
 
 from networkx.classes.multidigraph import MultiDiGraph
 from typeguard import TypeCheckError, check_type
@@ -9,6 +13,54 @@ from fuseline.utils.logging import get_logger
 # Get the logger
 logger = get_logger()
 
+
+@functools.lru_cache(maxsize=None)
+def _cached_signature(func: Callable[..., Any]) -> Tuple[inspect.Signature, Dict[str, inspect.Parameter]]:
+    """Parse a callable's signature once; networks are rebuilt from the same functions on every run."""
+    signature = inspect.signature(func)
+    return signature, dict(signature.parameters)
+
+
+# NOTE: Mirrors the numeric tower typeguard applies to `float` and `complex` annotations.
+_NUMERIC_TOWER: Dict[type, Tuple[type, ...]] = {float: (int, float), complex: (int, float, complex)}
+
+
+def _instance_types(annotation: Any) -> Optional[Tuple[type, ...]]:
+    """Types satisfying an annotation with a plain `isinstance` check, or None if typeguard is needed."""
+    if annotation is Any:
+        return (object,)
+
+    if typing.get_origin(annotation) in (Union, types.UnionType):
+        members: Tuple[type, ...] = ()
+        for arg in typing.get_args(annotation):
+            arg_types = _instance_types(arg)
+            if arg_types is None:
+                return None
+            members += arg_types
+        return members
+
+    if (
+        not isinstance(annotation, type)
+        or typing.get_origin(annotation) is not None
+        or getattr(annotation, "_is_protocol", False)
+        or typing.is_typeddict(annotation)
+    ):
+        return None
+
+    return _NUMERIC_TOWER.get(annotation, (annotation,))
+
+
+def _jit(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Compile a gear in numba's nopython mode, or leave it as is when numba is not installed."""
+    try:
+        import numba  # type: ignore[import]
+    except ImportError:
+        logger.warning("numba is not installed, gear {} runs uncompiled", func.__name__)
+        return func
+
+    return numba.njit(cache=True)(func)
+
+
 class NodeRaisedError(Exception):
     """Gear exception."""
 
@@ -47,7 +99,7 @@ class GraphAssociationMixin:
     def set_graph(self, graph: Optional[MultiDiGraph]) -> None:
         """Associate/Disassociate graph with/from a node."""
         self._graph = graph
-        logger.debug(f"Graph set for {self.__class__.__name__}")
+        logger.debug("Graph set for {}", self.__class__.__name__)
 
 class Signature(GraphAssociationMixin):
     """Analyze function signature."""
@@ -56,18 +108,23 @@ class Signature(GraphAssociationMixin):
         """Signature constructor."""
         self._func = func
         self._name = func.__name__
-        self._signature = inspect.signature(func)
-        self._params = dict(self._signature.parameters)
+        self._signature, params = _cached_signature(func)
+        self._params = dict(params)
         self._return_type = self._signature.return_annotation
 
         super().__init__(graph=graph)
-        logger.debug(f"Signature created for function: {self._name}")
+        logger.debug("Signature created for function: {}", self._name)
 
     @property
     def name(self) -> str:
         """Returns the name of the wrapped object."""
         return self._name
 
+    @property
+    def func(self) -> Callable[..., Any]:
+        """Returns the wrapped callable."""
+        return self._func
+
     @property
     def output_type(self) -> Any:
         """Get output type."""
@@ -83,24 +140,93 @@ class GearNode(Signature):
 
     shape = "circle"
 
-    def __init__(self, func: Callable[..., Any], graph: Optional[MultiDiGraph] = None) -> None:
-        """Gear constructor."""
+    def __init__(
+        self,
+        func: Callable[..., Any],
+        graph: Optional[MultiDiGraph] = None,
+        jit: bool = False,
+        pure: bool = False,
+        cache_size: int = 128,
+    ) -> None:
+        """
+        Gear constructor.
+
+        Args:
+        jit (bool): Compile the gear with numba when it is installed.
+        pure (bool): The gear's result depends only on its inputs, so results are memoized per input values.
+        cache_size (int): Number of memoized results kept for a pure gear.
+        """
         super().__init__(func, graph=graph)
-        logger.debug(f"GearNode created: {self.name}")
+        if jit:
+            self._func = _jit(func)
+
+        self._pure = pure
+        self._cache_size = cache_size
+        # NOTE: Shared by network copies, which clone gears shallowly, so repeated runs hit the same memo.
+        self._memo: OrderedDict[Hashable, Any] = OrderedDict()
+        self._predecessors: Optional[List[DataNode]] = None
+        logger.debug("GearNode created: {}", self.name)
 
     def __call__(self, *args: Any, **kwds: Any) -> Any:
         """Execute the given callable with in going nodes as parameters."""
         params = self.input_values
-        logger.debug(f"Executing GearNode: {self.name} with params: {params}")
+        logger.debug("Executing GearNode: {} with params: {}", self.name, params)
+
+        hit, result = self.recall(params)
+        if hit:
+            logger.debug("GearNode {} result recalled", self.name)
+            return result
 
         try:
             result = self._func(**params)
-            logger.debug(f"GearNode {self.name} execution completed")
-            return result
+            logger.debug("GearNode {} execution completed", self.name)
         except BaseException as e:
             logger.error(f"Error in GearNode {self.name}: {str(e)}")
             raise NodeRaisedError(self, params, e)
 
+        self.store(params, result)
+        return result
+
+    @property
+    def pure(self) -> bool:
+        """Whether results of the gear are memoized."""
+        return self._pure
+
+    def _memo_key(self, params: Dict[str, Any]) -> Optional[Hashable]:
+        """Key memoized results on input values and their types; None when some value is unhashable."""
+        # NOTE: Types are part of the key since equal values such as 1, 1.0 and True must not share a result.
+        key = tuple((name, type(value), value) for name, value in sorted(params.items()))
+        try:
+            hash(key)
+        except TypeError:
+            return None
+        return key
+
+    def recall(self, params: Dict[str, Any]) -> Tuple[bool, Any]:
+        """Look up the memoized result of a pure gear, returning whether it was found."""
+        if not self._pure:
+            return False, None
+
+        key = self._memo_key(params)
+        if key is None or key not in self._memo:
+            return False, None
+
+        self._memo.move_to_end(key)
+        return True, self._memo[key]
+
+    def store(self, params: Dict[str, Any], result: Any) -> None:
+        """Memoize the result of a pure gear, evicting the least recently used one when full."""
+        if not self._pure:
+            return
+
+        key = self._memo_key(params)
+        if key is None:
+            return
+
+        self._memo[key] = result
+        if len(self._memo) > self._cache_size:
+            self._memo.popitem(last=False)
+
     def __repr__(self) -> str:
         """String representation of a gear."""
         return self.name
@@ -116,9 +242,16 @@ class GearNode(Signature):
             logger.error(f"No graph associated with GearNode: {self.name}")
             raise ValueError("no graph associated")
 
-        params: Dict[str, Any] = {p.name: p.value for p in self._graph.predecessors(self)}  # type: ignore
+        if self._predecessors is None:
+            self._predecessors = list(self._graph.predecessors(self))  # type: ignore
 
-        return params
+        # NOTE: Predecessors are always data nodes; their attributes are read directly as this runs per gear call.
+        return {p._name: p._value for p in self._predecessors}
+
+    def set_graph(self, graph: Optional[MultiDiGraph]) -> None:
+        """Associate/Disassociate graph with/from a gear, forgetting its cached predecessors."""
+        super().set_graph(graph)
+        self._predecessors = None
 
 class DataNode(GraphAssociationMixin):
     """Node representing data."""
@@ -133,10 +266,13 @@ class DataNode(GraphAssociationMixin):
         """Data node constructor."""
         self._name: str = name
         self._value: Optional[Any] = value
+        self._initial_value: Optional[Any] = value
+        self._is_set = False
         self._annotation: type = annotation
+        self._instance_types = _instance_types(annotation)
 
         super().__init__(graph=graph)
-        logger.debug(f"DataNode created: {self._name}")
+        logger.debug("DataNode created: {}", self._name)
 
     def __repr__(self) -> str:
         """String representation."""
@@ -188,17 +324,30 @@ class DataNode(GraphAssociationMixin):
         """Check if the data node is empty."""
         return self._value is None
 
+    @property
+    def is_set(self) -> bool:
+        """Check if a value was assigned with `set_value()`, even if that value is None."""
+        return self._is_set
+
     def set_value(self, value: Any) -> None:
         """Sets node value."""
-        logger.debug(f"Setting value for DataNode: {self.name}")
+        logger.debug("Setting value for DataNode: {}", self.name)
         try:
-            check_type(value, self._annotation)
+            # NOTE: Plain annotations are checked with `isinstance`; typeguard handles the rest and reports errors.
+            if self._instance_types is None or not isinstance(value, self._instance_types):
+                check_type(value, self._annotation)
         except TypeCheckError as e:
             logger.error(f"Invalid type for DataNode {self.name}: {str(e)}")
             raise TypeError(f"`{self.name}` received invalid type - {e}")
 
         self._value = value
-        logger.debug(f"Value set for DataNode: {self.name}")
+        self._is_set = True
+        logger.debug("Value set for DataNode: {}", self.name)
+
+    def reset(self) -> None:
+        """Restore the value the node was created with."""
+        self._value = self._initial_value
+        self._is_set = False
 
 class GearInput(DataNode):
     """Input to the gear."""
@@ -23,7 +23,7 @@
 import pytest
 from click.testing import CliRunner
 
-from fuseline.cli.__main__ import ls, run
+from fuseline.cli.__main__ import _coerce, ls, run
 from fuseline.core.config import FuselineConfig
 
 
@@ -112,3 +112,23 @@ def test_run_command_with_workflow_not_found_error(mock_get_fuseline_config, moc
 
     assert result.exit_code == 0
     assert "ERROR! Workflow `test_workflow` not found." in result.output
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [("42", 42), ("-3", -3), ("0.25", 0.25), ("1e3", 1000.0), ("abc", "abc"), ("1.2.3", "1.2.3")],
+)
+def test_coerce_command_line_values(value, expected):
+    result = _coerce(value)
+    assert result == expected
+    assert type(result) is type(expected)
+
+
+def test_run_command_strips_only_option_prefix(mock_get_fuseline_config, mocker):
+    workflow = mocker.MagicMock()
+    mocker.patch("fuseline.cli.__main__.get_fuseline_config", return_value={"wf": workflow})
+    runner = CliRunner()
+    result = runner.invoke(run, ["wf", "--x", "1", "---y", "2.5"])
+
+    assert result.exit_code == 0
+    workflow.run.assert_called_once_with(x=1, **{"-y": 2.5})
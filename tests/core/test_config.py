@@ -0,0 +1,75 @@
+import pytest
+
+from fuseline.core.config import FuselineConfig, NetworkConfig, get_fuseline_config, source_execution_node
+from fuseline.core.network import WorkflowNotFoundError
+from fuseline.workflows.fake_eval import evaluate_model
+
+
+def test_source_execution_node_resolves_and_caches():
+    source_execution_node.cache_clear()
+
+    assert source_execution_node("fuseline.workflows.fake_eval.evaluate_model") is evaluate_model
+    assert source_execution_node("fuseline.workflows.fake_eval.evaluate_model") is evaluate_model
+    assert source_execution_node.cache_info().hits == 1
+
+
+PYPROJECT = """
+[tool.fuseline.config]
+engine = "{engine}"
+
+[tool.fuseline.workflows]
+fake_eval = ["fuseline.workflows.fake_eval.evaluate_model"]
+"""
+
+
+def test_get_fuseline_config_is_cached_per_file_revision(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text(PYPROJECT.format(engine="SerialEngine"))
+    get_fuseline_config.cache_clear()
+
+    config = get_fuseline_config()
+    assert config is not None
+    assert get_fuseline_config() == config
+
+    pyproject.write_text(PYPROJECT.format(engine="PoolEngine"))
+    reloaded = get_fuseline_config()
+    assert reloaded is not config
+    assert reloaded.config.engine == "PoolEngine"
+
+
+CONFIG_OBJ = {
+    "config": {"engine": "SerialEngine"},
+    "workflows": {"fake_eval": ["fuseline.workflows.fake_eval.evaluate_model"]},
+}
+
+
+def test_model_construct_trusted_matches_validated_config():
+    assert FuselineConfig.model_construct_trusted(CONFIG_OBJ) == FuselineConfig.model_validate(CONFIG_OBJ)
+
+
+def test_workflows_table_round_trips_through_model_dump():
+    config = FuselineConfig.model_validate(CONFIG_OBJ)
+
+    assert [workflow.name for workflow in config.workflows] == ["fake_eval"]
+    assert config.model_dump() == CONFIG_OBJ
+
+
+def test_network_config_resolves_outputs_once(mocker):
+    outputs = ["fuseline.workflows.fake_eval.evaluate_model"]
+    network_config = NetworkConfig(name="fake_eval", outputs=outputs)
+    resolve = mocker.patch("fuseline.core.config.source_execution_node", return_value=evaluate_model)
+
+    first, second = network_config.build(), network_config.build()
+
+    assert resolve.call_count == 1
+    assert first is not second
+    assert network_config.model_dump() == {"name": "fake_eval", "outputs": outputs}
+
+
+def test_fuseline_config_getitem():
+    config = FuselineConfig.model_construct_trusted(CONFIG_OBJ)
+
+    assert config["fake_eval"].name == "fake_eval"
+    with pytest.raises(WorkflowNotFoundError):
+        config["missing"]
@@ -0,0 +1,251 @@
+import gc
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Optional
+
+import pytest
+
+from fuseline.core.engines import PoolEngine, SerialEngine
+from fuseline.core.network import Depends, Network
+from fuseline.core.nodes import GearNode, InvalidGraphError, NodeRaisedError
+from fuseline.typing import Computed
+from fuseline.workflows.fake_eval import evaluate_model
+
+
+def double(x: int) -> int:
+    return 2 * x
+
+
+def triple(y: int) -> int:
+    return 3 * y
+
+
+def increment(tripled: Computed[int] = Depends(triple)) -> int:
+    return tripled + 1
+
+
+def add(doubled: Computed[int] = Depends(double), incremented: Computed[int] = Depends(increment)) -> int:
+    return doubled + incremented
+
+
+@pytest.mark.parametrize(
+    "engine_factory",
+    [
+        SerialEngine,
+        lambda: PoolEngine(max_workers=2),
+        lambda: PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor),
+    ],
+)
+def test_engine_executes_network(engine_factory):
+    engine = engine_factory()
+    engine.setup()
+    try:
+        network = engine.execute(
+            Network("fake_eval", outputs=[evaluate_model]),
+            true_positives=42,
+            false_positives=3,
+            false_negatives=1,
+        )
+    finally:
+        engine.teardown()
+
+    assert [result.value for result in network.results] == ["Excellent model performance with F1 score of 0.95"]
+
+
+def test_engine_rejects_output_with_multiple_producers():
+    network = Network("fake_eval", outputs=[evaluate_model])
+    gears = [node for node in network.graph.nodes if isinstance(node, GearNode)]
+    output = network.results[0]
+    network.graph.add_edge(next(gear for gear in gears if gear.name != "evaluate_model"), output)
+
+    with pytest.raises(InvalidGraphError):
+        SerialEngine().execute(network, true_positives=42, false_positives=3, false_negatives=1)
+
+
+def test_pool_engine_reuses_pool_across_executions():
+    engine = PoolEngine(max_workers=2)
+    executors = []
+    try:
+        for _ in range(2):
+            network = engine.execute(
+                Network("fake_eval", outputs=[evaluate_model]),
+                true_positives=1,
+                false_positives=1,
+                false_negatives=1,
+            )
+            assert network.results[0].value == "Model needs improvement. F1 score: 0.50"
+            executors.append(engine._executor)
+
+        assert executors[0] is not None
+        assert executors[0] is executors[1]
+    finally:
+        engine.teardown()
+
+    assert not engine.is_ready()
+
+
+def test_pool_engine_context_manager_owns_the_pool():
+    with PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor) as engine:
+        assert engine.is_ready()
+        network = engine.execute(Network("fan_in", outputs=[add]), x=3, y=4)
+
+    assert network.results[0].value == 19
+    assert not engine.is_ready()
+
+
+@pytest.mark.parametrize(
+    "engine_factory",
+    [SerialEngine, lambda: PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor)],
+)
+def test_engine_executes_fan_in_network(engine_factory):
+    engine = engine_factory()
+    engine.setup()
+    try:
+        network = engine.execute(Network("fan_in", outputs=[add]), x=3, y=4)
+    finally:
+        engine.teardown()
+
+    assert [result.value for result in network.results] == [19]
+
+
+def five() -> int:
+    return 5
+
+
+def _plus(offset):
+    def plus(value: Computed[int] = Depends(five)) -> int:
+        return value + offset
+
+    plus.__name__ = f"plus_{offset}"
+    return plus
+
+
+def test_pool_engine_submits_ready_gears_in_chunks(mocker):
+    engine = PoolEngine(max_workers=1, executor_cls=ThreadPoolExecutor)
+    submit = mocker.spy(ThreadPoolExecutor, "submit")
+    try:
+        network = engine.execute(Network("fan_out", outputs=[_plus(offset) for offset in range(8)]))
+    finally:
+        engine.teardown()
+
+    assert sorted(result.value for result in network.results) == list(range(5, 13))
+    # Eight gears are ready up front, so a single worker receives them two at a time.
+    assert [len(call.args[2]) for call in submit.call_args_list[:4]] == [2, 2, 2, 2]
+
+
+def explode(fuse: int) -> int:
+    raise RuntimeError(f"boom after {fuse}")
+
+
+@pytest.mark.parametrize("executor_cls", [ProcessPoolExecutor, ThreadPoolExecutor])
+def test_pool_engine_reports_failing_gear(executor_cls):
+    engine = PoolEngine(max_workers=2, executor_cls=executor_cls)
+    try:
+        with pytest.raises(NodeRaisedError) as excinfo:
+            engine.execute(Network("explode", outputs=[explode]), fuse=3)
+    finally:
+        engine.teardown()
+
+    assert excinfo.value.gear.name == "explode"
+    assert excinfo.value.params == {"fuse": 3}
+    assert isinstance(excinfo.value.raised_exception, RuntimeError)
+
+
+def square(z: int) -> int:
+    square.calls += 1
+    return z * z
+
+
+def _shifted():
+    def shifted(squared: Computed[int] = Depends(square, pure=True)) -> int:
+        return squared + 1
+
+    return shifted
+
+
+@pytest.mark.parametrize(
+    "engine_factory",
+    [SerialEngine, lambda: PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor)],
+)
+def test_engine_recalls_pure_gear_results(engine_factory):
+    square.calls = 0
+    network = Network("pure", outputs=[_shifted()], engine=engine_factory())
+
+    try:
+        results = [network.run(z=z).results[0].value for z in (3, 3, 4, 3)]
+    finally:
+        network._engine.teardown()
+
+    assert results == [10, 10, 17, 10]
+    assert square.calls == 2
+
+
+def test_pool_engine_releases_pool_when_dropped():
+    engine = PoolEngine(max_workers=1, executor_cls=ThreadPoolExecutor)
+    engine.setup()
+    executor = engine._executor
+
+    del engine
+    gc.collect()
+
+    assert executor._shutdown
+
+
+def nothing(x: int) -> Optional[int]:
+    return None
+
+
+def identity(x: int) -> int:
+    return x
+
+
+def maybe_double(value: Computed[Optional[int]] = Depends(nothing)) -> int:
+    return 0 if value is None else 2 * value
+
+
+@pytest.mark.parametrize(
+    "engine_factory",
+    [SerialEngine, lambda: PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor)],
+)
+def test_engine_finishes_when_a_gear_returns_none(engine_factory):
+    engine = engine_factory()
+    try:
+        network = engine.execute(Network("none", outputs=[nothing, identity, maybe_double]), x=1)
+    finally:
+        engine.teardown()
+
+    assert {result.name: result.value for result in network.results} == {
+        "nothing": None,
+        "identity": 1,
+        "maybe_double": 0,
+    }
+
+
+def test_output_gears_accept_gear_options():
+    square.calls = 0
+    network = Network("pure_output", outputs=[Depends(square, pure=True)], engine=SerialEngine())
+
+    assert [network.run(z=5).results[0].value for _ in range(2)] == [25, 25]
+    assert square.calls == 1
+
+
+def test_pool_engine_uses_the_network_predecessor_map():
+    network = Network("fan_in", outputs=[add])
+
+    with PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor) as engine:
+        engine.execute(network, x=3, y=4)
+        assert engine._pred is network.predecessor_map()
+
+
+@pytest.mark.parametrize(
+    "engine_factory",
+    [SerialEngine, lambda: PoolEngine(max_workers=2, executor_cls=ThreadPoolExecutor)],
+)
+def test_engine_recomputes_a_network_executed_twice(engine_factory):
+    engine = engine_factory()
+    network = Network("fan_in", outputs=[add])
+    try:
+        results = [engine.execute(network, x=x, y=4).results[0].value for x in (3, 5)]
+    finally:
+        engine.teardown()
+
+    assert results == [19, 23]
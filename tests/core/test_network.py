@@ -0,0 +1,142 @@
+import json
+import zlib
+
+import pytest
+
+from fuseline.core.engines import PoolEngine, SerialEngine
+from fuseline.core.network import Depends, Network
+from fuseline.typing import Computed
+from fuseline.workflows.fake_eval import evaluate_model
+
+
+def test_node_lists_are_cached_until_the_graph_grows():
+    network = Network("fake_eval", outputs=[evaluate_model])
+
+    assert network.roots is network.roots
+    assert network.inputs is network.inputs
+    assert network.outputs is network.outputs
+    assert network.input_shape is network.input_shape
+    assert set(network.input_shape) == {"true_positives", "false_positives", "false_negatives"}
+
+    inputs, succ = network.inputs, network._successor_map()
+    assert succ is network._successor_map()
+    network._attach_output(network.roots[0], name="extra")
+
+    assert network.inputs is not inputs
+    assert "extra" in [node.name for node in network._successor_map()[network.roots[0]]]
+    assert "extra" in [output.name for output in network.outputs]
+
+
+def source(x: int) -> int:
+    return x
+
+
+def left(value: Computed[int] = Depends(source)) -> int:
+    return value + 1
+
+
+def right(value: Computed[int] = Depends(source)) -> int:
+    return value + 2
+
+
+def join(a: Computed[int] = Depends(left), b: Computed[int] = Depends(right)) -> int:
+    return a * b
+
+
+def test_compute_next_releases_gears_once_their_inputs_are_computed():
+    network = Network("diamond", outputs=[join])
+    network.set_input({"x": 1})
+
+    sources = network.compute_next()
+    assert sorted(output.name for output in sources) == ["value", "value"]
+    assert network.compute_next() == sources
+
+    for output in sources:
+        output.set_value(1)
+    branches = network.compute_next()
+    assert sorted(output.name for output in branches) == ["a", "b"]
+
+    branches[0].set_value(2)
+    assert network.compute_next() == [branches[1]]
+
+    branches[1].set_value(3)
+    assert [output.name for output in network.compute_next()] == ["join"]
+
+
+def test_identifier_is_crc32_of_name_and_version():
+    network = Network("diamond", outputs=[join], version="1.2.3")
+
+    assert network.identifier == zlib.crc32(b"diamond-1.2.3")
+
+
+def test_copy_clones_nodes_and_resets_values():
+    network = Network("diamond", outputs=[join])
+    network.set_input({"x": 1})
+
+    clone = network.copy(name="renamed")
+
+    assert clone.name == "renamed"
+    assert clone.graph.number_of_nodes() == network.graph.number_of_nodes()
+    assert clone.graph.number_of_edges() == network.graph.number_of_edges()
+    assert not set(clone.graph.nodes) & set(network.graph.nodes)
+    assert all(node.graph is clone.graph for node in clone.graph.nodes)
+    assert all(node.is_empty for node in clone.inputs)
+    assert [result.name for result in clone.results] == ["join"]
+
+
+def test_set_input_fills_every_input_sharing_a_name():
+    network = Network("diamond", outputs=[join])
+    network.set_input({"x": 4})
+
+    assert [node.value for node in network.inputs_by_name["x"]] == [4, 4]
+    assert network.run(x=1).results[0].value == 6
+
+
+def test_network_picks_engine_from_graph_width():
+    assert isinstance(Network("fake_eval", outputs=[evaluate_model])._engine, SerialEngine)
+
+    network = Network("diamond", outputs=[join])
+    assert isinstance(network._engine, PoolEngine)
+    assert network.copy()._engine is network._engine
+
+    engine = SerialEngine()
+    assert Network("diamond", outputs=[join], engine=engine)._engine is engine
+
+
+def five() -> int:
+    return 5
+
+
+def test_roots_are_gears_fed_only_by_graph_inputs():
+    network = Network("diamond", outputs=[join])
+
+    assert sorted(gear.name for gear in network.roots) == ["source", "source"]
+    assert [gear.name for gear in Network("constant", outputs=[five]).roots] == ["five"]
+
+
+def test_set_input_reports_missing_and_extra_keys():
+    network = Network("diamond", outputs=[join])
+
+    with pytest.raises(ValueError, match="Input data format is incorrect") as excinfo:
+        network.set_input({"y": 1})
+
+    assert "Missing" in str(excinfo.value)
+    assert "Extra" in str(excinfo.value)
+
+
+def test_check_input_data_as_json_reports_every_key():
+    network = Network("diamond", outputs=[join])
+
+    report = json.loads(network._check_input_data({"x": 1}, network.input_shape, as_json=True))
+
+    assert report == {"keys": [{"name": "x", "expected": str(int), "provided": "1", "status": "correct"}]}
+
+
+def test_copy_keeps_the_network_subclass():
+    class TaggedNetwork(Network):
+        pass
+
+    clone = TaggedNetwork("diamond", outputs=[join]).copy()
+
+    assert type(clone) is TaggedNetwork
+    assert clone.run(x=1).results[0].value == 6
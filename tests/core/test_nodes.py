@@ -0,0 +1,100 @@
+import sys
+from typing import Any, List, Optional
+
+import pytest
+
+from fuseline.core.network import Network
+from fuseline.core.nodes import GearInput, GearNode, _cached_signature
+
+
+def scale(x: int, factor: int = 2) -> int:
+    return x * factor
+
+
+def test_gears_share_parsed_signature_but_not_params():
+    _cached_signature.cache_clear()
+
+    first, second = GearNode(scale), GearNode(scale)
+
+    assert _cached_signature.cache_info().hits == 1
+    assert first.output_type is int
+    assert list(first.params) == ["x", "factor"]
+    assert first.params is not second.params
+
+
+@pytest.mark.parametrize(
+    ("annotation", "value"),
+    [(int, 1), (float, 1), (complex, 1.5), (Optional[int], None), (int | str, "a"), (Any, object()), (List[int], [1])],
+)
+def test_set_value_accepts_matching_values(annotation, value):
+    node = GearInput("x", None, annotation)
+    node.set_value(value)
+
+    assert node.value is value
+
+
+@pytest.mark.parametrize(
+    ("annotation", "value"),
+    [(int, "1"), (float, "1.0"), (Optional[int], 1.5), (int | str, None), (List[int], ["1"])],
+)
+def test_set_value_rejects_mismatching_values(annotation, value):
+    node = GearInput("x", None, annotation)
+
+    with pytest.raises(TypeError, match="`x` received invalid type"):
+        node.set_value(value)
+
+
+def test_jit_gear_is_compiled_with_numba(mocker):
+    numba = mocker.Mock()
+    mocker.patch.dict(sys.modules, {"numba": numba})
+
+    gear = GearNode(scale, jit=True)
+
+    numba.njit.assert_called_once_with(cache=True)
+    numba.njit.return_value.assert_called_once_with(scale)
+    assert gear.func is numba.njit.return_value.return_value
+    assert list(gear.params) == ["x", "factor"]
+
+
+def test_jit_gear_falls_back_without_numba(mocker):
+    mocker.patch.dict(sys.modules, {"numba": None})
+
+    gear = GearNode(scale, jit=True)
+
+    assert gear.func is scale
+    assert gear.name == "scale"
+
+
+def test_pure_gear_memo_is_bounded_and_skips_unhashable_inputs():
+    gear = GearNode(scale, pure=True, cache_size=1)
+
+    gear.store({"x": 1, "factor": 2}, 2)
+    assert gear.recall({"factor": 2, "x": 1}) == (True, 2)
+
+    gear.store({"x": 2, "factor": 2}, 4)
+    assert gear.recall({"x": 1, "factor": 2}) == (False, None)
+
+    gear.store({"x": [2], "factor": 2}, [4])
+    assert gear.recall({"x": [2], "factor": 2}) == (False, None)
+    assert not GearNode(scale).recall({"x": 2, "factor": 2})[0]
+
+
+def test_pure_gear_memo_distinguishes_equal_values_of_different_types():
+    gear = GearNode(scale, pure=True)
+
+    gear.store({"x": 1, "factor": 2}, 2)
+
+    assert gear.recall({"x": 1, "factor": 2}) == (True, 2)
+    assert gear.recall({"x": 1.0, "factor": 2}) == (False, None)
+    assert gear.recall({"x": True, "factor": 2}) == (False, None)
+
+
+def test_input_values_follow_the_current_graph():
+    network = Network("scale", outputs=[scale])
+    gear = next(node for node in network.graph.nodes if isinstance(node, GearNode))
+    network.set_input({"x": 3, "factor": 4})
+    assert gear.input_values == {"x": 3, "factor": 4}
+
+    clone = network.copy()
+    clone_gear = next(node for node in clone.graph.nodes if isinstance(node, GearNode))
+    assert clone_gear.input_values == {"x": None, "factor": 2}